@@ -20,19 +20,20 @@ import logging
 import sys
 from pathlib import Path
 
-from kokoro.analyzer import Analyzer
+from kokoro import __version__
 from kokoro.config import load_settings
-from kokoro.deepgram_client import KokoroDeepgramClient
-from kokoro.report import export_json, render_sentiment_chart, render_text
 
 
 def _setup_logging(verbose: bool = False) -> None:
-    level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s  %(levelname)-8s  %(name)s — %(message)s",
-        datefmt="%H:%M:%S",
-    )
+    if verbose:
+        logging.basicConfig(
+            level=logging.DEBUG,
+            format="%(asctime)s  %(levelname)-8s  %(name)s — %(message)s",
+            datefmt="%H:%M:%S",
+        )
+    else:
+        # No timestamps on the quiet path — skips a strftime per record
+        logging.basicConfig(level=logging.INFO, format="%(levelname)-8s  %(message)s")
 
 
 # ---------------------------------------------------------------------------
@@ -41,18 +42,25 @@ def _setup_logging(verbose: bool = False) -> None:
 
 async def _cmd_analyze(args: argparse.Namespace) -> None:
     """Run audio analysis (CLI mode)."""
+    from kokoro.analyzer import Analyzer
+    from kokoro.deepgram_client import KokoroDeepgramClient
+    from kokoro.report import export_json, render_sentiment_chart, render_text
+
     settings = load_settings()
     dg = KokoroDeepgramClient(settings.deepgram)
     analyzer = Analyzer(settings.analytics)
 
     # Transcribe + analyse
-    if args.file:
-        result = await dg.analyze_file(args.file)
-    elif args.url:
-        result = await dg.analyze_url(args.url)
-    else:
-        print("Error: provide --file or --url", file=sys.stderr)
-        sys.exit(1)
+    try:
+        if args.file:
+            result = await dg.analyze_file(args.file)
+        elif args.url:
+            result = await dg.analyze_url(args.url)
+        else:
+            print("Error: provide --file or --url", file=sys.stderr)
+            sys.exit(1)
+    finally:
+        await dg.close()
 
     report = analyzer.analyze(result)
 
@@ -85,24 +93,53 @@ def _cmd_discord(_args: argparse.Namespace) -> None:
 # Argument parser
 # ---------------------------------------------------------------------------
 
-def _build_parser() -> argparse.ArgumentParser:
+_SUBCOMMANDS = ("analyze", "discord")
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Return the subcommand named in *argv*, or ``None`` for top-level help/version."""
+    for arg in argv:
+        if arg in ("-h", "--help", "--version"):
+            return None
+        if arg in _SUBCOMMANDS:
+            return arg
+    return None
+
+
+def _add_analyze_parser(sub: argparse._SubParsersAction) -> None:
+    p_analyze = sub.add_parser("analyze", help="Analyze an audio file or URL")
+    source = p_analyze.add_mutually_exclusive_group(required=True)
+    source.add_argument("-f", "--file", type=str, help="Path to a local audio file")
+    source.add_argument("-u", "--url", type=str, help="Public URL of an audio file")
+    p_analyze.add_argument("-o", "--output", type=str, help="Output directory (default: ./output)")
+    p_analyze.add_argument("-s", "--save", action="store_true", help="Save JSON report and chart to disk")
+
+
+def _add_discord_parser(sub: argparse._SubParsersAction) -> None:
+    sub.add_parser("discord", help="Start the Discord bot")
+
+
+def _build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    When *command* is given only that subparser is registered; otherwise all
+    of them are (needed to render the top-level ``--help``).
+    """
     parser = argparse.ArgumentParser(
         prog="kokoro",
         description="🎧 Kokoro Bot — The Vibe Architect. Audio intelligence that reveals the magic hidden in conversations.",
     )
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable debug logging")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
     sub = parser.add_subparsers(dest="command")
 
     # ---- analyze ----------------------------------------------------------
-    p_analyze = sub.add_parser("analyze", help="Analyze an audio file or URL")
-    source = p_analyze.add_mutually_exclusive_group(required=True)
-    source.add_argument("-f", "--file", type=str, help="Path to a local audio file")
-    source.add_argument("-u", "--url", type=str, help="Public URL of an audio file")
-    p_analyze.add_argument("-o", "--output", type=str, help="Output directory (default: ./output)")
-    p_analyze.add_argument("-s", "--save", action="store_true", help="Save JSON report and chart to disk")
+    if command in (None, "analyze"):
+        _add_analyze_parser(sub)
 
     # ---- discord ----------------------------------------------------------
-    sub.add_parser("discord", help="Start the Discord bot")
+    if command in (None, "discord"):
+        _add_discord_parser(sub)
 
     return parser
 
@@ -112,7 +149,7 @@ def _build_parser() -> argparse.ArgumentParser:
 # ---------------------------------------------------------------------------
 
 def main() -> None:
-    parser = _build_parser()
+    parser = _build_parser(_sniff_subcommand(sys.argv[1:]))
     args = parser.parse_args()
     _setup_logging(args.verbose)
 
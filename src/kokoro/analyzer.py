@@ -6,16 +6,16 @@ with derived insights: vibe shifts, hot topics, consensus level, action items.
 
 from __future__ import annotations
 
+import heapq
 import logging
 import re
-from collections import defaultdict
+from bisect import bisect_right
 
 from kokoro.config import AnalyticsConfig
 from kokoro.models import (
     ActionItem,
     ConsensusLevel,
     HotTopic,
-    Sentiment,
     SentimentSegment,
     TopicEntry,
     TranscriptionResult,
@@ -25,31 +25,39 @@ from kokoro.models import (
 
 logger = logging.getLogger(__name__)
 
-# Intent keywords that signal an action / commitment
-_ACTION_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"\b(will|going to|need to|have to|must|should|plan to|commit to)\b", re.I),
-    re.compile(r"\b(deliver|finish|complete|send|submit|prepare|schedule|fix|deploy)\b", re.I),
-    re.compile(r"\b(action item|next step|follow.up|take.away)\b", re.I),
-]
+# Intent keywords that signal an action / commitment (one alternation → one scan per text)
+_ACTION_RE: re.Pattern[str] = re.compile(
+    r"\b(?:"
+    r"will|going to|need to|have to|must|should|plan to|commit to"
+    r"|deliver|finish|complete|send|submit|prepare|schedule|fix|deploy"
+    r"|action item|next step|follow.up|take.away"
+    r")\b",
+    re.I,
+)
 
-# Intent labels from Deepgram that hint at agreement / disagreement
-_AFFIRMATION_KEYWORDS = {"affirm", "agree", "confirm", "approve", "accept", "yes", "affirmation"}
-_DISAGREEMENT_KEYWORDS = {"disagree", "deny", "reject", "refuse", "oppose", "no", "disagreement"}
+# Intent labels from Deepgram that hint at agreement / disagreement.
+# Anchored at the start of a word (any inflection may follow), so e.g.
+# "agreed" counts but "disagree" never counts as "agree".
+_AFFIRMATION_RE: re.Pattern[str] = re.compile(
+    r"\b(?:affirm|agree|confirm|approv|accept)\w*|\byes\b",
+    re.I,
+)
+_DISAGREEMENT_RE: re.Pattern[str] = re.compile(
+    r"\b(?:disagree|den(?:y|ied|ial)|reject|refus|oppos)\w*|\bno\b",
+    re.I,
+)
 
 
 def _is_action_like(text: str) -> bool:
-    return any(p.search(text) for p in _ACTION_PATTERNS)
+    return _ACTION_RE.search(text) is not None
 
 
 def _classify_intent(intent_label: str) -> str | None:
     """Return 'affirm', 'disagree', or None."""
-    lower = intent_label.lower()
-    for kw in _AFFIRMATION_KEYWORDS:
-        if kw in lower:
-            return "affirm"
-    for kw in _DISAGREEMENT_KEYWORDS:
-        if kw in lower:
-            return "disagree"
+    if _AFFIRMATION_RE.search(intent_label):
+        return "affirm"
+    if _DISAGREEMENT_RE.search(intent_label):
+        return "disagree"
     return None
 
 
@@ -73,11 +81,17 @@ class Analyzer:
             sentiment_segments=result.sentiment_segments,
         )
 
+        # Nothing to analyse (e.g. silence) → same report the full pipeline would give
+        if not (result.sentiment_segments or result.topic_segments or result.intent_segments):
+            report.affirmation_ratio = 0.5
+            report.consensus_level = self._ratio_to_level(0.5)
+            logger.info("Analysis skipped — no segments in transcription result.")
+            return report
+
         report.vibe_shifts = self._detect_vibe_shifts(result.sentiment_segments)
         report.hot_topics = self._detect_hot_topics(result)
         report.top_topics = self._collect_top_topics(result)
-        report.action_items = self._extract_action_items(result)
-        affirmation_ratio = self._compute_consensus(result)
+        report.action_items, affirmation_ratio = self._scan_intents(result)
         report.affirmation_ratio = affirmation_ratio
         report.consensus_level = self._ratio_to_level(affirmation_ratio)
 
@@ -120,22 +134,30 @@ class Analyzer:
 
     def _detect_hot_topics(self, result: TranscriptionResult) -> list[HotTopic]:
         """Cross-reference topic segments with sentiment to find 'hot' topics."""
-        # Build a mapping: word-index range → sentiment score
-        word_sentiment: dict[tuple[int, int], SentimentSegment] = {}
-        for seg in result.sentiment_segments:
-            word_sentiment[(seg.start_word, seg.end_word)] = seg
+        if not result.topic_segments or not result.sentiment_segments:
+            return []
+        neg_threshold = self._cfg.negative_sentiment_threshold
+        min_confidence = self._cfg.min_confidence
+
+        # Deepgram sentiment segments are contiguous and non-overlapping, so once
+        # sorted by start word their end words are sorted too — each topic segment
+        # only needs to walk back from the last segment starting before it ends.
+        sent_sorted = sorted(result.sentiment_segments, key=lambda s: s.start_word)
+        starts = [s.start_word for s in sent_sorted]
 
         hot: list[HotTopic] = []
         for tseg in result.topic_segments:
-            # Find the closest sentiment segment (overlapping word range)
+            # Find the most negative overlapping sentiment segment
             best_sent: SentimentSegment | None = None
-            for (sw, ew), sseg in word_sentiment.items():
-                if tseg.start_word <= ew and tseg.end_word >= sw:
-                    if best_sent is None or sseg.sentiment_score < best_sent.sentiment_score:
-                        best_sent = sseg
-            if best_sent and best_sent.sentiment_score < self._cfg.negative_sentiment_threshold:
+            i = bisect_right(starts, tseg.end_word) - 1
+            while i >= 0 and sent_sorted[i].end_word >= tseg.start_word:
+                sseg = sent_sorted[i]
+                if best_sent is None or sseg.sentiment_score <= best_sent.sentiment_score:
+                    best_sent = sseg
+                i -= 1
+            if best_sent and best_sent.sentiment_score < neg_threshold:
                 for te in tseg.topics:
-                    if te.confidence_score >= self._cfg.min_confidence:
+                    if te.confidence_score >= min_confidence:
                         hot.append(
                             HotTopic(
                                 topic=te.topic,
@@ -157,23 +179,26 @@ class Analyzer:
 
     def _collect_top_topics(self, result: TranscriptionResult) -> list[TopicEntry]:
         """Aggregate and rank all detected topics."""
-        agg: dict[str, float] = defaultdict(float)
+        agg: dict[str, float] = {}
         for tseg in result.topic_segments:
             for te in tseg.topics:
-                agg[te.topic] = max(agg[te.topic], te.confidence_score)
-        entries = [TopicEntry(topic=t, confidence_score=s) for t, s in agg.items()]
-        return sorted(entries, key=lambda e: e.confidence_score, reverse=True)[:10]
+                agg[te.topic] = max(agg.get(te.topic, 0.0), te.confidence_score)
+        top = heapq.nlargest(10, agg.items(), key=lambda kv: kv[1])
+        return [TopicEntry(topic=t, confidence_score=s) for t, s in top]
 
     # ------------------------------------------------------------------
-    # Action Items
+    # Action Items + Consensus (single pass over intent segments)
     # ------------------------------------------------------------------
 
-    def _extract_action_items(self, result: TranscriptionResult) -> list[ActionItem]:
-        """Extract intents that look like actions / commitments."""
+    def _scan_intents(self, result: TranscriptionResult) -> tuple[list[ActionItem], float]:
+        """Extract action items and the affirmation ratio (0.0 – 1.0) in one pass."""
         items: list[ActionItem] = []
+        affirm = 0
+        total = 0
         for iseg in result.intent_segments:
+            text_is_action = _is_action_like(iseg.text)
             for ie in iseg.intents:
-                if _is_action_like(iseg.text) or _is_action_like(ie.intent):
+                if text_is_action or _is_action_like(ie.intent):
                     items.append(
                         ActionItem(
                             text=iseg.text,
@@ -181,26 +206,14 @@ class Analyzer:
                             confidence=ie.confidence_score,
                         )
                     )
-        return items
-
-    # ------------------------------------------------------------------
-    # Consensus (affirmation vs. disagreement ratio)
-    # ------------------------------------------------------------------
-
-    def _compute_consensus(self, result: TranscriptionResult) -> float:
-        """Return the ratio of affirmation intents (0.0 – 1.0)."""
-        affirm = 0
-        total = 0
-        for iseg in result.intent_segments:
-            for ie in iseg.intents:
                 cls = _classify_intent(ie.intent)
                 if cls is not None:
                     total += 1
                     if cls == "affirm":
                         affirm += 1
         if total == 0:
-            return 0.5  # No data → neutral
-        return affirm / total
+            return items, 0.5  # No data → neutral
+        return items, affirm / total
 
     @staticmethod
     def _ratio_to_level(ratio: float) -> ConsensusLevel:
@@ -2,17 +2,44 @@
 
 from __future__ import annotations
 
+import functools
 import os
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from dotenv import load_dotenv
-
 # ---------------------------------------------------------------------------
-# Load .env from project root
+# .env lives in the project root — loaded lazily by ``load_settings()``
 # ---------------------------------------------------------------------------
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
-load_dotenv(_PROJECT_ROOT / ".env")
+
+# A "#" only starts a comment on an unquoted value when whitespace precedes it
+_INLINE_COMMENT_RE = re.compile(r"\s+#")
+
+
+def _load_env(path: Path) -> None:
+    """Load ``KEY=VALUE`` lines from *path* into ``os.environ``.
+
+    Variables already set in the environment take precedence. Blank lines,
+    ``#`` comments (whole-line, or after whitespace on an unquoted value),
+    quoted values and an optional ``export`` prefix are supported.
+    """
+    if not path.is_file():
+        return
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, _, value = line.removeprefix("export ").partition("=")
+        value = value.strip()
+        quote = value[:1]
+        end = value.find(quote, 1) if quote in ("'", '"') else -1
+        if end != -1:
+            # Quoted: everything up to the matching quote, comments after it dropped
+            value = value[1:end]
+        else:
+            value = _INLINE_COMMENT_RE.split(value, maxsplit=1)[0]
+        os.environ.setdefault(key.strip(), value)
 
 
 @dataclass(frozen=True)
@@ -60,8 +87,13 @@ class Settings:
     output_dir: Path = field(default_factory=lambda: Path("output"))
 
 
+@functools.lru_cache(maxsize=1)
 def load_settings() -> Settings:
-    """Build a ``Settings`` instance from environment variables."""
+    """Build a ``Settings`` instance from environment variables.
+
+    The ``.env`` file is read on the first call only; the result is cached.
+    """
+    _load_env(_PROJECT_ROOT / ".env")
 
     deepgram = DeepgramConfig(
         api_key=os.getenv("DEEPGRAM_API_KEY", ""),
@@ -5,9 +5,14 @@ Supports both **local file** and **remote URL** audio sources.
 
 from __future__ import annotations
 
+import functools
 import logging
+import os
+from collections.abc import AsyncIterator
 from pathlib import Path
 
+import aiofiles
+import httpx
 from deepgram import AsyncDeepgramClient
 
 from kokoro.config import DeepgramConfig
@@ -21,53 +26,62 @@ from kokoro.models import (
     TranscriptionResult,
     WordInfo,
 )
+from kokoro.utils import parse_json
 
 logger = logging.getLogger(__name__)
 
+# Size of each chunk streamed to Deepgram when uploading a local file
+_UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Transcribing long recordings can take minutes; keep a few warm connections
+_HTTP_TIMEOUT = httpx.Timeout(300.0, connect=10.0)
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=10)
+
+# api_key → (SDK client, its HTTP pool), shared by every KokoroDeepgramClient using that key
+_CLIENT_CACHE: dict[str, tuple[AsyncDeepgramClient, httpx.AsyncClient]] = {}
+
 
 # ---------------------------------------------------------------------------
 # Helpers to parse the raw Deepgram JSON into typed dataclasses
 # ---------------------------------------------------------------------------
 
+_SENTIMENT_BY_LABEL: dict[str, Sentiment] = {s.value: s for s in Sentiment}
+
+
+@functools.lru_cache(maxsize=16)
 def _parse_sentiment(raw: str) -> Sentiment:
-    try:
-        return Sentiment(raw.lower())
-    except ValueError:
-        return Sentiment.NEUTRAL
+    return _SENTIMENT_BY_LABEL.get(raw.lower(), Sentiment.NEUTRAL)
 
 
 def _parse_words(words_raw: list[dict]) -> list[WordInfo]:
-    out: list[WordInfo] = []
-    for w in words_raw:
-        out.append(
-            WordInfo(
-                word=w.get("punctuated_word", w.get("word", "")),
-                start=w.get("start", 0.0),
-                end=w.get("end", 0.0),
-                confidence=w.get("confidence", 0.0),
-                sentiment=_parse_sentiment(w.get("sentiment", "neutral")),
-                sentiment_score=w.get("sentiment_score", 0.0),
-                speaker=w.get("speaker"),
-            )
+    return [
+        WordInfo(
+            word=w.get("punctuated_word") or w.get("word", ""),
+            start=w.get("start", 0.0),
+            end=w.get("end", 0.0),
+            confidence=w.get("confidence", 0.0),
+            sentiment=_parse_sentiment(w.get("sentiment", "neutral")),
+            sentiment_score=w.get("sentiment_score", 0.0),
+            speaker=w.get("speaker"),
         )
-    return out
+        for w in words_raw
+    ]
 
 
 def _parse_sentiment_segments(data: dict) -> tuple[list[SentimentSegment], float, Sentiment]:
     sentiments = data.get("sentiments", {})
     if not sentiments:
         return [], 0.0, Sentiment.NEUTRAL
-    segments: list[SentimentSegment] = []
-    for seg in sentiments.get("segments", []):
-        segments.append(
-            SentimentSegment(
-                text=seg.get("text", ""),
-                start_word=seg.get("start_word", 0),
-                end_word=seg.get("end_word", 0),
-                sentiment=_parse_sentiment(seg.get("sentiment", "neutral")),
-                sentiment_score=seg.get("sentiment_score", 0.0),
-            )
+    segments = [
+        SentimentSegment(
+            text=seg.get("text", ""),
+            start_word=seg.get("start_word", 0),
+            end_word=seg.get("end_word", 0),
+            sentiment=_parse_sentiment(seg.get("sentiment", "neutral")),
+            sentiment_score=seg.get("sentiment_score", 0.0),
         )
+        for seg in sentiments.get("segments", [])
+    ]
     avg = sentiments.get("average", {})
     avg_score = avg.get("sentiment_score", 0.0)
     avg_label = _parse_sentiment(avg.get("sentiment", "neutral"))
@@ -78,42 +92,36 @@ def _parse_topic_segments(data: dict) -> list[TopicSegment]:
     topics = data.get("topics", {})
     if not topics:
         return []
-    segments: list[TopicSegment] = []
-    for seg in topics.get("segments", []):
-        entries = [
-            TopicEntry(topic=t.get("topic", ""), confidence_score=t.get("confidence_score", 0.0))
-            for t in seg.get("topics", [])
-        ]
-        segments.append(
-            TopicSegment(
-                text=seg.get("text", ""),
-                start_word=seg.get("start_word", 0),
-                end_word=seg.get("end_word", 0),
-                topics=entries,
-            )
+    return [
+        TopicSegment(
+            text=seg.get("text", ""),
+            start_word=seg.get("start_word", 0),
+            end_word=seg.get("end_word", 0),
+            topics=[
+                TopicEntry(topic=t.get("topic", ""), confidence_score=t.get("confidence_score", 0.0))
+                for t in seg.get("topics", [])
+            ],
         )
-    return segments
+        for seg in topics.get("segments", [])
+    ]
 
 
 def _parse_intent_segments(data: dict) -> list[IntentSegment]:
     intents = data.get("intents", {})
     if not intents:
         return []
-    segments: list[IntentSegment] = []
-    for seg in intents.get("segments", []):
-        entries = [
-            IntentEntry(intent=i.get("intent", ""), confidence_score=i.get("confidence_score", 0.0))
-            for i in seg.get("intents", [])
-        ]
-        segments.append(
-            IntentSegment(
-                text=seg.get("text", ""),
-                start_word=seg.get("start_word", 0),
-                end_word=seg.get("end_word", 0),
-                intents=entries,
-            )
+    return [
+        IntentSegment(
+            text=seg.get("text", ""),
+            start_word=seg.get("start_word", 0),
+            end_word=seg.get("end_word", 0),
+            intents=[
+                IntentEntry(intent=i.get("intent", ""), confidence_score=i.get("confidence_score", 0.0))
+                for i in seg.get("intents", [])
+            ],
         )
-    return segments
+        for seg in intents.get("segments", [])
+    ]
 
 
 def _build_options(cfg: DeepgramConfig) -> dict:
@@ -132,16 +140,18 @@ def _build_options(cfg: DeepgramConfig) -> dict:
 
 def _result_to_dict(result: object) -> dict:
     """Convert SDK result to a plain dict regardless of the SDK version."""
+    if isinstance(result, dict):
+        return result
+    if isinstance(result, (bytes, str)):
+        return parse_json(result)
     if hasattr(result, "to_dict"):
         return result.to_dict()  # type: ignore[union-attr]
     if hasattr(result, "model_dump"):
         return result.model_dump()  # type: ignore[union-attr]
-    if isinstance(result, dict):
-        return result
+    if hasattr(result, "to_json"):
+        return parse_json(result.to_json())  # type: ignore[union-attr]
     # Fallback: try JSON round-trip
-    import json as _json
-
-    return _json.loads(str(result))
+    return parse_json(str(result))
 
 
 def _parse_response(raw: dict) -> TranscriptionResult:
@@ -186,6 +196,37 @@ def _parse_response(raw: dict) -> TranscriptionResult:
     )
 
 
+class _FileUpload:
+    """Upload body that streams *path* afresh every time it is iterated.
+
+    The SDK retries failed requests (connection errors, 5xx, 429, ...) by
+    re-sending the same body, so a one-shot generator would go out empty on
+    the second attempt. httpx accepts any async iterable, and each attempt
+    gets a new pass over the file starting from byte 0.
+
+    On Linux every pass tells the kernel the file is read sequentially and
+    evicts each chunk from the page cache once read, so uploading a large
+    recording does not push other processes' data out of memory.
+    """
+
+    def __init__(self, path: Path, chunk_size: int = _UPLOAD_CHUNK_SIZE) -> None:
+        self._path = path
+        self._chunk_size = chunk_size
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        fadvise = getattr(os, "posix_fadvise", None)
+        async with aiofiles.open(self._path, "rb") as f:
+            fd = f.fileno()
+            if fadvise:
+                fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            offset = 0
+            while chunk := await f.read(self._chunk_size):
+                if fadvise:
+                    fadvise(fd, offset, len(chunk), os.POSIX_FADV_DONTNEED)
+                offset += len(chunk)
+                yield chunk
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -200,7 +241,25 @@ class KokoroDeepgramClient:
                 "Create a .env file (see .env.example) or set the environment variable."
             )
         self._config = config
-        self._client = AsyncDeepgramClient(api_key=config.api_key)
+        # DeepgramConfig is frozen, so the request options never change
+        self._options = _build_options(config)
+        cached = _CLIENT_CACHE.get(config.api_key)
+        if cached is None:
+            http = httpx.AsyncClient(timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS)
+            client = AsyncDeepgramClient(api_key=config.api_key, httpx_client=http)
+            cached = _CLIENT_CACHE[config.api_key] = (client, http)
+        self._client, self._http = cached
+
+    async def close(self) -> None:
+        """Close the shared HTTP pool for this API key and drop it from the cache.
+
+        Every ``KokoroDeepgramClient`` using the same key shares the pool, so
+        call this once on shutdown.
+        """
+        cached = _CLIENT_CACHE.get(self._config.api_key)
+        if cached is not None and cached[1] is self._http:
+            del _CLIENT_CACHE[self._config.api_key]
+        await self._http.aclose()
 
     # ---- Local file -------------------------------------------------------
 
@@ -211,12 +270,21 @@ class KokoroDeepgramClient:
             raise FileNotFoundError(f"Audio file not found: {path}")
 
         logger.info("Analyzing local file: %s", path)
-        buffer = path.read_bytes()
-        options = _build_options(self._config)
+        response = await self._client.listen.v1.media.transcribe_file(
+            request=_FileUpload(path),  # type: ignore[arg-type]  # re-iterable, see _FileUpload
+            **self._options,
+        )
+        raw = _result_to_dict(response)
+        return _parse_response(raw)
+
+    # ---- In-memory audio --------------------------------------------------
 
+    async def analyze_bytes(self, data: bytes) -> TranscriptionResult:
+        """Transcribe + analyse audio that is already in memory (e.g. an upload)."""
+        logger.info("Analyzing in-memory audio (%.1f KB)", len(data) / 1024)
         response = await self._client.listen.v1.media.transcribe_file(
-            request=buffer,
-            **options,
+            request=data,
+            **self._options,
         )
         raw = _result_to_dict(response)
         return _parse_response(raw)
@@ -226,11 +294,9 @@ class KokoroDeepgramClient:
     async def analyze_url(self, url: str) -> TranscriptionResult:
         """Transcribe + analyse a remote audio file by URL."""
         logger.info("Analyzing remote URL: %s", url)
-        options = _build_options(self._config)
-
         response = await self._client.listen.v1.media.transcribe_url(
             url=url,
-            **options,
+            **self._options,
         )
         raw = _result_to_dict(response)
         return _parse_response(raw)
@@ -12,8 +12,7 @@ from __future__ import annotations
 import asyncio
 import io
 import logging
-import tempfile
-from pathlib import Path
+from typing import TYPE_CHECKING
 
 import discord
 from discord import app_commands
@@ -24,12 +23,14 @@ from kokoro.analyzer import Analyzer
 from kokoro.config import Settings
 from kokoro.deepgram_client import KokoroDeepgramClient
 from kokoro.report import (
-    build_discord_embed_data,
+    build_discord_embed,
     render_sentiment_chart,
-    render_text,
 )
 from kokoro.voice_recorder import VoiceRecorder
 
+if TYPE_CHECKING:
+    from kokoro.models import TranscriptionResult
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,10 +55,36 @@ class KokoroBot(commands.Bot):
         await self.tree.sync()
         logger.info("Slash commands synced.")
 
+    async def close(self) -> None:
+        await self._dg.close()
+        await super().close()
+
     async def on_ready(self) -> None:
         logger.info("Kokoro Bot is online as %s", self.user)
 
 
+# ---------------------------------------------------------------------------
+# Shared helpers
+# ---------------------------------------------------------------------------
+
+async def _send_vibe_report(
+    interaction: discord.Interaction,
+    bot: KokoroBot,
+    result: TranscriptionResult,
+) -> None:
+    """Analyse *result*, then send the Vibe Report embed with its chart attached."""
+    report = await asyncio.to_thread(bot._analyzer.analyze, result)
+    embed = build_discord_embed(report)
+
+    chart_bytes = await asyncio.to_thread(render_sentiment_chart, report)
+    files: list[discord.File] = []
+    if chart_bytes:
+        files.append(discord.File(io.BytesIO(chart_bytes), filename="vibe_chart.png"))
+        embed.set_image(url="attachment://vibe_chart.png")
+
+    await interaction.followup.send(embed=embed, files=files)
+
+
 # ---------------------------------------------------------------------------
 # Slash commands
 # ---------------------------------------------------------------------------
@@ -69,25 +96,7 @@ def _analyze_url_cmd(bot: KokoroBot) -> app_commands.Command:
         await interaction.response.defer(thinking=True)
         try:
             result = await bot._dg.analyze_url(url)
-            report = bot._analyzer.analyze(result)
-
-            # Build embed
-            embed_data = build_discord_embed_data(report)
-            embed = discord.Embed(
-                title=embed_data["title"],
-                color=embed_data["color"],
-            )
-            for f in embed_data["fields"]:
-                embed.add_field(name=f["name"], value=f["value"], inline=f.get("inline", False))
-
-            # Attach chart
-            chart_bytes = render_sentiment_chart(report)
-            files: list[discord.File] = []
-            if chart_bytes:
-                files.append(discord.File(io.BytesIO(chart_bytes), filename="vibe_chart.png"))
-                embed.set_image(url="attachment://vibe_chart.png")
-
-            await interaction.followup.send(embed=embed, files=files)
+            await _send_vibe_report(interaction, bot, result)
         except Exception:
             logger.exception("Error in /vibe-url")
             await interaction.followup.send("❌ Something went wrong analysing that audio.", ephemeral=True)
@@ -101,34 +110,13 @@ def _analyze_file_cmd(bot: KokoroBot) -> app_commands.Command:
     async def vibe_file(interaction: discord.Interaction, audio: discord.Attachment) -> None:
         await interaction.response.defer(thinking=True)
         try:
-            # Download the attachment to a temp file
-            with tempfile.NamedTemporaryFile(suffix=Path(audio.filename).suffix, delete=False) as tmp:
-                await audio.save(tmp.name)  # type: ignore[arg-type]
-                tmp_path = Path(tmp.name)
-
-            result = await bot._dg.analyze_file(tmp_path)
-            report = bot._analyzer.analyze(result)
-
-            embed_data = build_discord_embed_data(report)
-            embed = discord.Embed(
-                title=embed_data["title"],
-                color=embed_data["color"],
-            )
-            for f in embed_data["fields"]:
-                embed.add_field(name=f["name"], value=f["value"], inline=f.get("inline", False))
-
-            chart_bytes = render_sentiment_chart(report)
-            files: list[discord.File] = []
-            if chart_bytes:
-                files.append(discord.File(io.BytesIO(chart_bytes), filename="vibe_chart.png"))
-                embed.set_image(url="attachment://vibe_chart.png")
-
-            await interaction.followup.send(embed=embed, files=files)
+            # Send the attachment straight to Deepgram — no temp file round-trip
+            data = await audio.read()
+            result = await bot._dg.analyze_bytes(data)
+            await _send_vibe_report(interaction, bot, result)
         except Exception:
             logger.exception("Error in /vibe-file")
             await interaction.followup.send("❌ Something went wrong analysing that audio.", ephemeral=True)
-        finally:
-            tmp_path.unlink(missing_ok=True)
 
     return vibe_file
 
@@ -137,29 +125,6 @@ def _analyze_file_cmd(bot: KokoroBot) -> app_commands.Command:
 # Voice channel commands — /join and /leave
 # ---------------------------------------------------------------------------
 
-async def _send_vibe_report(
-    interaction: discord.Interaction,
-    bot: KokoroBot,
-    report: "VibeReport",  # noqa: F821
-) -> None:
-    """Build and send the Vibe Report embed (shared helper)."""
-    embed_data = build_discord_embed_data(report)
-    embed = discord.Embed(
-        title=embed_data["title"],
-        color=embed_data["color"],
-    )
-    for f in embed_data["fields"]:
-        embed.add_field(name=f["name"], value=f["value"], inline=f.get("inline", False))
-
-    chart_bytes = render_sentiment_chart(report)
-    files: list[discord.File] = []
-    if chart_bytes:
-        files.append(discord.File(io.BytesIO(chart_bytes), filename="vibe_chart.png"))
-        embed.set_image(url="attachment://vibe_chart.png")
-
-    await interaction.followup.send(embed=embed, files=files)
-
-
 def _join_cmd(bot: KokoroBot) -> app_commands.Command:
     @app_commands.command(
         name="join",
@@ -197,7 +162,7 @@ def _join_cmd(bot: KokoroBot) -> app_commands.Command:
             vc: VoiceRecvClient = await channel.connect(cls=VoiceRecvClient)  # type: ignore[assignment]
 
             recorder = VoiceRecorder()
-            recorder.start(vc)
+            recorder.start(vc, output_dir=bot.settings.output_dir)
             bot._recorders[guild.id] = recorder
 
             await interaction.followup.send(
@@ -233,7 +198,7 @@ def _leave_cmd(bot: KokoroBot) -> app_commands.Command:
         wav_path = None
         try:
             # Stop recording → get WAV file
-            wav_path = await recorder.stop(output_dir=bot.settings.output_dir)
+            wav_path = await recorder.stop()
             bot._recorders.pop(guild.id, None)
 
             # Disconnect from voice
@@ -242,12 +207,9 @@ def _leave_cmd(bot: KokoroBot) -> app_commands.Command:
 
             await interaction.followup.send("⏹️ Recording stopped. Analysing the conversation…")
 
-            # Analyse with Deepgram
+            # Analyse with Deepgram and send the report
             result = await bot._dg.analyze_file(wav_path)
-            report = bot._analyzer.analyze(result)
-
-            # Send the report
-            await _send_vibe_report(interaction, bot, report)
+            await _send_vibe_report(interaction, bot, result)
 
         except Exception:
             logger.exception("Error in /leave")
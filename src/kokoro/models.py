@@ -1,6 +1,7 @@
 """Domain models used across the Kokoro pipeline.
 
-All models are plain dataclasses — no heavy dependencies.
+All models are plain slotted dataclasses — no heavy dependencies, and no
+per-instance ``__dict__`` since long transcripts create many of them.
 """
 
 from __future__ import annotations
@@ -29,7 +30,7 @@ class ConsensusLevel(str, Enum):
 # Raw Deepgram results (thin wrappers for type safety)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class WordInfo:
     word: str
     start: float
@@ -40,7 +41,7 @@ class WordInfo:
     speaker: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SentimentSegment:
     text: str
     start_word: int
@@ -49,7 +50,7 @@ class SentimentSegment:
     sentiment_score: float
 
 
-@dataclass
+@dataclass(slots=True)
 class TopicSegment:
     text: str
     start_word: int
@@ -57,13 +58,13 @@ class TopicSegment:
     topics: list[TopicEntry] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TopicEntry:
     topic: str
     confidence_score: float
 
 
-@dataclass
+@dataclass(slots=True)
 class IntentSegment:
     text: str
     start_word: int
@@ -71,13 +72,13 @@ class IntentSegment:
     intents: list[IntentEntry] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IntentEntry:
     intent: str
     confidence_score: float
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionResult:
     """All raw data returned by the Deepgram API for one audio source."""
 
@@ -96,7 +97,7 @@ class TranscriptionResult:
 # Derived insights (produced by the Analytics Engine)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class VibeShift:
     """A moment where the sentiment changed drastically."""
 
@@ -108,7 +109,7 @@ class VibeShift:
     to_sentiment: Sentiment
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HotTopic:
     """A topic associated with strong (usually negative) sentiment."""
 
@@ -118,7 +119,7 @@ class HotTopic:
     context_text: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ActionItem:
     """An intent that looks like an action/commitment."""
 
@@ -127,7 +128,7 @@ class ActionItem:
     confidence: float
 
 
-@dataclass
+@dataclass(slots=True)
 class VibeReport:
     """The final output — the 'magic information' delivered to the user."""
 
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 import json
+from bisect import bisect_right
+from dataclasses import asdict, is_dataclass
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
 
@@ -13,10 +17,40 @@ def ensure_dir(path: Path) -> Path:
     return path
 
 
+@functools.lru_cache(maxsize=1)
+def _orjson() -> ModuleType | None:
+    """Return the optional ``orjson`` module, or ``None`` when it isn't installed."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def parse_json(data: str | bytes) -> Any:
+    """Decode a JSON document, using ``orjson`` when it is installed."""
+    orjson = _orjson()
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
 def save_json(data: Any, path: Path) -> Path:
-    """Serialise *data* as pretty-printed JSON and write to *path*."""
+    """Serialise *data* (dataclasses included) as pretty-printed JSON and write to *path*.
+
+    Uses ``orjson`` when it is installed, otherwise the stdlib ``json`` module.
+    """
     ensure_dir(path.parent)
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False, default=str), encoding="utf-8")
+    orjson = _orjson()
+    if orjson is None:
+        if is_dataclass(data) and not isinstance(data, type):
+            data = asdict(data)
+        path.write_text(json.dumps(data, indent=2, ensure_ascii=False, default=str), encoding="utf-8")
+    else:
+        # orjson serialises dataclasses natively — no asdict() deep copy
+        path.write_bytes(
+            orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
     return path
 
 
@@ -25,15 +59,14 @@ def clamp(value: float, low: float = -1.0, high: float = 1.0) -> float:
     return max(low, min(high, value))
 
 
+# Lower bounds of each sentiment bucket and the emoji for every bucket
+_EMOJI_THRESHOLDS = (-0.3, 0.0, 0.3)
+_EMOJIS = ("😠", "😟", "😐", "😊")
+
+
 def sentiment_emoji(score: float) -> str:
     """Return an emoji that matches the sentiment score."""
-    if score >= 0.3:
-        return "😊"
-    if score >= 0.0:
-        return "😐"
-    if score >= -0.3:
-        return "😟"
-    return "😠"
+    return _EMOJIS[bisect_right(_EMOJI_THRESHOLDS, score)]
 
 
 def format_score(score: float) -> str:
@@ -1,19 +1,20 @@
 """Voice recording module — captures audio from a Discord voice channel.
 
 Uses ``discord-ext-voice-recv`` to receive decoded PCM from all speakers,
-mixes them into a single WAV file, and returns the path for analysis.
+streams them into a single WAV file, and returns the path for analysis.
 """
 
 from __future__ import annotations
 
-import io
 import logging
-import struct
 import tempfile
+import threading
+import time
 import wave
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 from discord.ext.voice_recv import BasicSink, VoiceData, VoiceRecvClient
 
 if TYPE_CHECKING:
@@ -26,9 +27,19 @@ SAMPLE_RATE = 48_000
 CHANNELS = 2
 SAMPLE_WIDTH = 2  # 16-bit = 2 bytes
 
+# Discord sends one 20 ms Opus frame per packet
+FRAME_DURATION = 0.02
+# How many frame slots to hold back for late packets before mixing them down
+JITTER_FRAMES = 5
+
 
 class VoiceRecorder:
-    """Records all incoming voice in a channel into a single WAV buffer.
+    """Records all incoming voice in a channel into a single WAV file.
+
+    Each speaker's packets are placed on a shared 20 ms timeline, overlapping
+    frames are summed (with int16 saturation) and finished frames are streamed
+    straight into the WAV file, so memory use stays flat no matter how long
+    the conversation runs. Slots where nobody spoke are skipped.
 
     Usage::
 
@@ -39,7 +50,15 @@ class VoiceRecorder:
     """
 
     def __init__(self) -> None:
-        self._buffer = io.BytesIO()
+        self._wav: wave.Wave_write | None = None
+        self._wav_path: Path | None = None
+        # voice-recv invokes the sink callback from its own decoder thread
+        self._lock = threading.Lock()
+        # frame slot → int32 mix accumulator, for slots not yet written out
+        self._mix: dict[int, np.ndarray] = {}
+        # speaker id → next free slot, keeps each speaker's frames sequential
+        self._next_slot: dict[int | None, int] = {}
+        self._t0 = 0.0
         self._recording = False
         self._voice_client: VoiceRecvClient | None = None
 
@@ -51,32 +70,46 @@ class VoiceRecorder:
     # Start / stop
     # ------------------------------------------------------------------
 
-    def start(self, voice_client: VoiceRecvClient) -> None:
-        """Begin listening on *voice_client*."""
+    def start(self, voice_client: VoiceRecvClient, output_dir: Path | None = None) -> None:
+        """Begin listening on *voice_client*, writing the WAV file into *output_dir*."""
         if self._recording:
             raise RuntimeError("Already recording.")
 
-        self._buffer = io.BytesIO()
+        self._wav_path, self._wav = self._open_wav(output_dir)
+        self._mix.clear()
+        self._next_slot.clear()
+        self._t0 = time.monotonic()
         self._recording = True
         self._voice_client = voice_client
 
         sink = BasicSink(self._on_audio)
-        voice_client.listen(sink)
+        try:
+            voice_client.listen(sink)
+        except Exception:
+            self._discard_wav()
+            raise
         logger.info("🎙️ Recording started.")
 
-    async def stop(self, output_dir: Path | None = None) -> Path:
-        """Stop recording and write the WAV file to disk.
+    async def stop(self) -> Path:
+        """Stop recording and finalise the WAV file on disk.
 
         Returns the ``Path`` to the WAV file.
         """
-        if not self._recording or self._voice_client is None:
+        if not self._recording or self._voice_client is None or self._wav_path is None:
             raise RuntimeError("Not currently recording.")
 
         self._voice_client.stop_listening()
         self._recording = False
-        logger.info("⏹️ Recording stopped. Flushing WAV …")
+        logger.info("⏹️ Recording stopped. Finalising WAV …")
+
+        with self._lock:
+            if self._wav is not None:
+                self._flush_mix()
+                self._wav.close()  # patches the RIFF header with the final length
+                self._wav = None
 
-        wav_path = self._flush_wav(output_dir)
+        wav_path = self._wav_path
+        self._wav_path = None
         logger.info("💾 WAV saved: %s (%.1f KB)", wav_path, wav_path.stat().st_size / 1024)
         return wav_path
 
@@ -86,27 +119,66 @@ class VoiceRecorder:
 
     def _on_audio(self, user: discord.Member | discord.User | None, data: VoiceData) -> None:
         """Callback invoked for each decoded audio packet."""
-        if data.pcm is not None:
-            self._buffer.write(data.pcm)
+        if data.pcm is None:
+            return
+        samples = np.frombuffer(data.pcm, dtype=np.int16).astype(np.int32)
+        speaker = user.id if user is not None else None
+        now_slot = int((time.monotonic() - self._t0) / FRAME_DURATION)
+
+        with self._lock:
+            if self._wav is None:
+                return
+            slot = max(now_slot, self._next_slot.get(speaker, 0))
+            self._next_slot[speaker] = slot + 1
+
+            acc = self._mix.get(slot)
+            if acc is None:
+                self._mix[slot] = samples
+            elif len(acc) >= len(samples):
+                acc[: len(samples)] += samples
+            else:
+                samples[: len(acc)] += acc
+                self._mix[slot] = samples
+
+            self._flush_mix(before=now_slot - JITTER_FRAMES)
+
+    def _flush_mix(self, before: int | None = None) -> None:
+        """Write mixed slots older than *before* (all slots if ``None``) to the WAV file.
+
+        Must be called with ``self._lock`` held.
+        """
+        ready = sorted(s for s in self._mix if before is None or s < before)
+        for slot in ready:
+            mixed = np.clip(self._mix.pop(slot), -32768, 32767).astype(np.int16)
+            # wave accepts any buffer — hand it the array's memory, no tobytes() copy
+            self._wav.writeframesraw(memoryview(mixed))  # type: ignore[union-attr]
+
+    def _discard_wav(self) -> None:
+        """Abort a recording that failed to start and remove its temp file."""
+        with self._lock:
+            if self._wav is not None:
+                self._wav.close()
+                self._wav = None
+        if self._wav_path is not None:
+            self._wav_path.unlink(missing_ok=True)
+            self._wav_path = None
+        self._recording = False
+        self._voice_client = None
 
-    def _flush_wav(self, output_dir: Path | None = None) -> Path:
-        """Wrap the raw PCM buffer in a WAV container and save to disk."""
+    @staticmethod
+    def _open_wav(output_dir: Path | None = None) -> tuple[Path, wave.Wave_write]:
+        """Create a temporary WAV file and return its path and an open writer."""
         if output_dir:
             output_dir.mkdir(parents=True, exist_ok=True)
-            fd = tempfile.NamedTemporaryFile(
-                suffix=".wav", dir=output_dir, delete=False
-            )
-        else:
-            fd = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-
-        wav_path = Path(fd.name)
-        pcm_data = self._buffer.getvalue()
-
-        with wave.open(fd, "wb") as wf:
-            wf.setnchannels(CHANNELS)
-            wf.setsampwidth(SAMPLE_WIDTH)
-            wf.setframerate(SAMPLE_RATE)
-            wf.writeframes(pcm_data)
-
-        self._buffer = io.BytesIO()
-        return wav_path
+        with tempfile.NamedTemporaryFile(suffix=".wav", dir=output_dir, delete=False) as fd:
+            wav_path = Path(fd.name)
+
+        try:
+            wf = wave.open(str(wav_path), "wb")
+        except OSError:
+            wav_path.unlink(missing_ok=True)
+            raise
+        wf.setnchannels(CHANNELS)
+        wf.setsampwidth(SAMPLE_WIDTH)
+        wf.setframerate(SAMPLE_RATE)
+        return wav_path, wf
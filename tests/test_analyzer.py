@@ -1,6 +1,12 @@
 """Unit tests for the Kokoro Analytics Engine."""
 
-from kokoro.analyzer import Analyzer
+import dataclasses
+import functools
+from collections.abc import Callable
+
+import pytest
+
+from kokoro.analyzer import Analyzer, _classify_intent
 from kokoro.config import AnalyticsConfig
 from kokoro.models import (
     ConsensusLevel,
@@ -11,41 +17,44 @@ from kokoro.models import (
     TopicEntry,
     TopicSegment,
     TranscriptionResult,
+    VibeReport,
 )
 
 
-def _make_sentiment_segments() -> list[SentimentSegment]:
-    """Create sample sentiment segments with a clear vibe shift."""
-    return [
-        SentimentSegment(
-            text="Hello everyone, welcome to the meeting.",
-            start_word=0, end_word=6,
-            sentiment=Sentiment.POSITIVE, sentiment_score=0.6,
-        ),
-        SentimentSegment(
-            text="Let's discuss the project progress.",
-            start_word=7, end_word=12,
-            sentiment=Sentiment.NEUTRAL, sentiment_score=0.1,
-        ),
-        SentimentSegment(
-            text="The deadline was missed and the client is upset.",
-            start_word=13, end_word=22,
-            sentiment=Sentiment.NEGATIVE, sentiment_score=-0.7,
-        ),
-        SentimentSegment(
-            text="We need to fix this immediately.",
-            start_word=23, end_word=29,
-            sentiment=Sentiment.NEGATIVE, sentiment_score=-0.5,
-        ),
-    ]
+# Sample sentiment segments with a clear vibe shift, built once at import
+_SENTIMENT_SEGMENTS: tuple[SentimentSegment, ...] = (
+    SentimentSegment(
+        text="Hello everyone, welcome to the meeting.",
+        start_word=0, end_word=6,
+        sentiment=Sentiment.POSITIVE, sentiment_score=0.6,
+    ),
+    SentimentSegment(
+        text="Let's discuss the project progress.",
+        start_word=7, end_word=12,
+        sentiment=Sentiment.NEUTRAL, sentiment_score=0.1,
+    ),
+    SentimentSegment(
+        text="The deadline was missed and the client is upset.",
+        start_word=13, end_word=22,
+        sentiment=Sentiment.NEGATIVE, sentiment_score=-0.7,
+    ),
+    SentimentSegment(
+        text="We need to fix this immediately.",
+        start_word=23, end_word=29,
+        sentiment=Sentiment.NEGATIVE, sentiment_score=-0.5,
+    ),
+)
+
+# The full transcript is just the segments read back to back
+_TRANSCRIPT = " ".join(seg.text for seg in _SENTIMENT_SEGMENTS)
 
 
 def _make_result() -> TranscriptionResult:
     return TranscriptionResult(
-        transcript="Hello everyone, welcome to the meeting. Let's discuss the project progress. The deadline was missed and the client is upset. We need to fix this immediately.",
+        transcript=_TRANSCRIPT,
         confidence=0.98,
         summary="Team meeting about a missed deadline. The client is upset and the team needs to fix the issue.",
-        sentiment_segments=_make_sentiment_segments(),
+        sentiment_segments=list(_SENTIMENT_SEGMENTS),
         sentiment_average=-0.125,
         sentiment_average_label=Sentiment.NEUTRAL,
         topic_segments=[
@@ -70,71 +79,162 @@ def _make_result() -> TranscriptionResult:
     )
 
 
-class TestVibeShiftDetection:
-    def test_detects_shift_between_positive_and_negative(self) -> None:
-        analyzer = Analyzer(AnalyticsConfig(vibe_shift_threshold=0.4))
-        result = _make_result()
-        report = analyzer.analyze(result)
+@pytest.fixture(scope="module")
+def sample_result() -> TranscriptionResult:
+    """Shared, read-only transcription result — copy it before mutating."""
+    return _make_result()
 
-        # The jump from +0.1 → -0.7 (delta 0.8) should be detected
-        assert len(report.vibe_shifts) >= 1
-        shift = report.vibe_shifts[0]
-        assert shift.delta >= 0.4
 
-    def test_no_shift_when_threshold_high(self) -> None:
-        analyzer = Analyzer(AnalyticsConfig(vibe_shift_threshold=5.0))
-        result = _make_result()
-        report = analyzer.analyze(result)
-        assert len(report.vibe_shifts) == 0
+@pytest.fixture(scope="session")
+def analyzer_factory() -> Callable[..., Analyzer]:
+    """Return a builder that shares one (stateless) ``Analyzer`` per config."""
 
+    @functools.lru_cache(maxsize=None)
+    def build(**thresholds: float) -> Analyzer:
+        return Analyzer(AnalyticsConfig(**thresholds))
 
-class TestHotTopics:
-    def test_detects_negative_topic(self) -> None:
-        analyzer = Analyzer(AnalyticsConfig(negative_sentiment_threshold=-0.3))
-        result = _make_result()
-        report = analyzer.analyze(result)
+    return build
 
-        assert len(report.hot_topics) >= 1
-        assert report.hot_topics[0].topic == "Missed deadline"
 
-    def test_no_hot_topics_when_threshold_extreme(self) -> None:
-        analyzer = Analyzer(AnalyticsConfig(negative_sentiment_threshold=-5.0))
-        result = _make_result()
-        report = analyzer.analyze(result)
-        assert len(report.hot_topics) == 0
+@pytest.fixture(scope="module")
+def default_report(
+    analyzer_factory: Callable[..., Analyzer], sample_result: TranscriptionResult
+) -> VibeReport:
+    """The default-config report for ``sample_result``, analysed once per module."""
+    return analyzer_factory().analyze(sample_result)
 
 
-class TestConsensus:
-    def test_consensus_with_affirmation(self) -> None:
-        analyzer = Analyzer()
-        result = _make_result()
+class TestVibeShiftDetection:
+    @pytest.mark.parametrize(
+        ("threshold", "expect_shift"),
+        [
+            (0.4, True),  # the jump from +0.1 → -0.7 (delta 0.8) clears it
+            (5.0, False),  # no sentiment delta can reach it
+        ],
+    )
+    def test_shift_detection_respects_threshold(
+        self,
+        analyzer_factory: Callable[..., Analyzer],
+        sample_result: TranscriptionResult,
+        threshold: float,
+        expect_shift: bool,
+    ) -> None:
+        report = analyzer_factory(vibe_shift_threshold=threshold).analyze(sample_result)
+
+        assert bool(report.vibe_shifts) is expect_shift
+        assert all(shift.delta >= threshold for shift in report.vibe_shifts)
+
+
+class TestHotTopics:
+    @pytest.mark.parametrize(
+        ("threshold", "expected_topics"),
+        [
+            (-0.3, ["Missed deadline"]),
+            (-5.0, []),  # nothing is that negative
+        ],
+    )
+    def test_hot_topics_respect_threshold(
+        self,
+        analyzer_factory: Callable[..., Analyzer],
+        sample_result: TranscriptionResult,
+        threshold: float,
+        expected_topics: list[str],
+    ) -> None:
+        report = analyzer_factory(negative_sentiment_threshold=threshold).analyze(sample_result)
+        assert [ht.topic for ht in report.hot_topics] == expected_topics
+
+    def test_uses_most_negative_overlapping_segment(
+        self, analyzer_factory: Callable[..., Analyzer], sample_result: TranscriptionResult
+    ) -> None:
+        analyzer = analyzer_factory()
+        result = dataclasses.replace(
+            sample_result,
+            topic_segments=[
+                TopicSegment(
+                    text="Project progress, the missed deadline and the fix.",
+                    start_word=10, end_word=25,
+                    topics=[TopicEntry(topic="Project status", confidence_score=0.8)],
+                ),
+            ],
+        )
         report = analyzer.analyze(result)
 
+        (hot_topic,) = report.hot_topics
+        assert hot_topic.sentiment_score == -0.7
+
+    def test_reports_every_hot_topic(self, analyzer_factory: Callable[..., Analyzer]) -> None:
+        negative = SentimentSegment(
+            text="Everything is on fire.", start_word=0, end_word=100,
+            sentiment=Sentiment.NEGATIVE, sentiment_score=-0.8,
+        )
+        result = TranscriptionResult(
+            sentiment_segments=[negative],
+            topic_segments=[
+                TopicSegment(
+                    text=f"Problem {i}.", start_word=i, end_word=i + 1,
+                    topics=[TopicEntry(topic=f"Problem {i}", confidence_score=0.9)],
+                )
+                for i in range(15)
+            ],
+        )
+        report = analyzer_factory().analyze(result)
+        assert len(report.hot_topics) == 15
+
+
+class TestConsensus:
+    def test_consensus_with_affirmation(self, default_report: VibeReport) -> None:
         # One affirmation intent out of 1 classifiable → 100 %
-        assert report.affirmation_ratio == 1.0
-        assert report.consensus_level == ConsensusLevel.HIGH
+        assert default_report.affirmation_ratio == 1.0
+        assert default_report.consensus_level == ConsensusLevel.HIGH
+
+
+class TestClassifyIntent:
+    def test_affirmation_labels(self) -> None:
+        assert _classify_intent("Affirmation") == "affirm"
+        assert _classify_intent("Express agreement") == "affirm"
+
+    @pytest.mark.parametrize(
+        ("label", "expected"),
+        [
+            ("Agreed", "affirm"),
+            ("Confirmed plan", "affirm"),
+            ("Accepted offer", "affirm"),
+            ("Approves", "affirm"),
+            ("Rejected", "disagree"),
+            ("Denied request", "disagree"),
+            ("Refused", "disagree"),
+            ("Opposed to change", "disagree"),
+        ],
+    )
+    def test_inflected_labels(self, label: str, expected: str) -> None:
+        assert _classify_intent(label) == expected
 
+    def test_disagreement_is_not_mistaken_for_agreement(self) -> None:
+        assert _classify_intent("Disagree with proposal") == "disagree"
+        assert _classify_intent("Disapprove of plan") is None
 
-class TestActionItems:
-    def test_detects_action_from_text(self) -> None:
-        analyzer = Analyzer()
-        result = _make_result()
-        report = analyzer.analyze(result)
 
+class TestActionItems:
+    def test_detects_action_from_text(self, default_report: VibeReport) -> None:
         # "We need to fix this immediately" matches the action pattern
-        assert len(report.action_items) >= 1
-        assert "fix" in report.action_items[0].text.lower()
+        items = default_report.action_items
+        assert items
+        assert "fix" in items[0].text.lower()
 
 
 class TestOverallReport:
-    def test_summary_is_passed_through(self) -> None:
-        analyzer = Analyzer()
-        result = _make_result()
-        report = analyzer.analyze(result)
-        assert report.summary == result.summary
-
-    def test_sentiment_segments_are_preserved(self) -> None:
-        analyzer = Analyzer()
-        result = _make_result()
-        report = analyzer.analyze(result)
-        assert len(report.sentiment_segments) == 4
+    def test_summary_is_passed_through(
+        self, default_report: VibeReport, sample_result: TranscriptionResult
+    ) -> None:
+        assert default_report.summary == sample_result.summary
+
+    def test_empty_result_yields_neutral_report(self, analyzer_factory: Callable[..., Analyzer]) -> None:
+        report = analyzer_factory().analyze(TranscriptionResult())
+        assert not report.vibe_shifts
+        assert not report.hot_topics
+        assert not report.action_items
+        assert report.affirmation_ratio == 0.5
+        assert report.consensus_level == ConsensusLevel.MODERATE
+
+    def test_sentiment_segments_are_preserved(self, default_report: VibeReport) -> None:
+        assert len(default_report.sentiment_segments) == 4
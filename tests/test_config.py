@@ -0,0 +1,65 @@
+"""Unit tests for the Kokoro configuration loader."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from kokoro.config import _load_env
+
+
+@pytest.fixture
+def environ(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    """Swap ``os.environ`` for a throwaway dict that ``_load_env`` writes into."""
+    env = {"PRESET": "from-shell"}
+    monkeypatch.setattr(os, "environ", env)
+    return env
+
+
+def _write_env(tmp_path: Path, text: str) -> Path:
+    path = tmp_path / ".env"
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class TestLoadEnv:
+    def test_strips_inline_comments_on_unquoted_values(self, environ: dict[str, str], tmp_path: Path) -> None:
+        _load_env(_write_env(
+            tmp_path,
+            "VIBE_SHIFT_THRESHOLD=0.4  # default\n"
+            "URL=https://example.com/#anchor\n",
+        ))
+        assert environ["VIBE_SHIFT_THRESHOLD"] == "0.4"
+        # Without whitespace before it, "#" is part of the value
+        assert environ["URL"] == "https://example.com/#anchor"
+
+    def test_quoted_values_end_at_the_matching_quote(self, environ: dict[str, str], tmp_path: Path) -> None:
+        _load_env(_write_env(
+            tmp_path,
+            'DOUBLE="x y" # comment\n'
+            "SINGLE='a # b'\n"
+            'EMPTY=""\n',
+        ))
+        assert environ["DOUBLE"] == "x y"
+        assert environ["SINGLE"] == "a # b"
+        assert environ["EMPTY"] == ""
+
+    def test_export_prefix_comments_and_blank_lines(self, environ: dict[str, str], tmp_path: Path) -> None:
+        _load_env(_write_env(
+            tmp_path,
+            "# Deepgram\n"
+            "\n"
+            "export DEEPGRAM_API_KEY=abc123\n"
+            "NOT_AN_ASSIGNMENT\n",
+        ))
+        assert environ["DEEPGRAM_API_KEY"] == "abc123"
+        assert "NOT_AN_ASSIGNMENT" not in environ
+
+    def test_existing_variables_are_not_overridden(self, environ: dict[str, str], tmp_path: Path) -> None:
+        _load_env(_write_env(tmp_path, "PRESET=from-file\n"))
+        assert environ["PRESET"] == "from-shell"
+
+    def test_missing_file_is_ignored(self, environ: dict[str, str], tmp_path: Path) -> None:
+        before = dict(environ)
+        _load_env(tmp_path / "missing.env")
+        assert environ == before
@@ -0,0 +1,84 @@
+"""Unit tests for the Deepgram client wrapper."""
+
+import os
+from pathlib import Path
+
+import httpx
+import pytest
+from deepgram import AsyncDeepgramClient
+from deepgram.core import http_client
+
+from kokoro import deepgram_client
+from kokoro.config import DeepgramConfig
+from kokoro.deepgram_client import KokoroDeepgramClient
+
+_API_KEY = "test-key"
+
+_RESPONSE = {
+    "metadata": {
+        "request_id": "test",
+        "sha256": "",
+        "created": "2024-01-01T00:00:00Z",
+        "duration": 1.0,
+        "channels": 1,
+        "models": [],
+        "model_info": {},
+    },
+    "results": {
+        "channels": [{"alternatives": [{"transcript": "hello", "confidence": 0.9, "words": []}]}],
+    },
+}
+
+
+@pytest.fixture
+def upload_bodies(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Route the client through a transport that fails once with a 503, then succeeds.
+
+    Returns the list of request body sizes the transport saw, one per attempt.
+    """
+    bodies: list[int] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(len(await request.aread()))
+        if len(bodies) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json=_RESPONSE)
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = AsyncDeepgramClient(api_key=_API_KEY, httpx_client=http)
+    monkeypatch.setitem(deepgram_client._CLIENT_CACHE, _API_KEY, (client, http))
+    # Retry immediately instead of backing off for a second
+    monkeypatch.setattr(http_client, "_retry_timeout", lambda response, retries: 0.0)
+    return bodies
+
+
+class TestUploadRetry:
+    async def test_retried_file_upload_resends_whole_file(
+        self, upload_bodies: list[int], tmp_path: Path
+    ) -> None:
+        audio = tmp_path / "audio.wav"
+        audio.write_bytes(b"\x00" * 3_000_000)
+        dg = KokoroDeepgramClient(DeepgramConfig(api_key=_API_KEY))
+
+        result = await dg.analyze_file(audio)
+        await dg.close()
+
+        assert upload_bodies == [3_000_000, 3_000_000]
+        assert result.transcript == "hello"
+
+    @pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="posix_fadvise is Linux-only")
+    async def test_retried_file_upload_keeps_page_cache_hints(
+        self, upload_bodies: list[int], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        audio = tmp_path / "audio.wav"
+        audio.write_bytes(b"\x00" * 3_000_000)
+        advice: list[int] = []
+        monkeypatch.setattr(os, "posix_fadvise", lambda fd, offset, length, hint: advice.append(hint))
+        dg = KokoroDeepgramClient(DeepgramConfig(api_key=_API_KEY))
+
+        await dg.analyze_file(audio)
+        await dg.close()
+
+        # Every attempt re-opens the file and advises it afresh
+        assert advice.count(os.POSIX_FADV_SEQUENTIAL) == 2
+        assert advice.count(os.POSIX_FADV_DONTNEED) == 2 * 3  # three 1 MiB chunks per attempt
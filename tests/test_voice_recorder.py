@@ -0,0 +1,124 @@
+"""Unit tests for the voice-channel recorder's mixer."""
+
+import sys
+import types
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+try:
+    import discord.ext.voice_recv  # noqa: F401
+except ImportError:
+    # Minimal stand-in so the recorder imports; the tests feed _on_audio directly
+    _voice_recv = types.ModuleType("discord.ext.voice_recv")
+    _voice_recv.BasicSink = lambda callback: callback  # type: ignore[attr-defined]
+    _voice_recv.VoiceData = object  # type: ignore[attr-defined]
+    _voice_recv.VoiceRecvClient = object  # type: ignore[attr-defined]
+    sys.modules["discord.ext.voice_recv"] = _voice_recv
+
+from kokoro import voice_recorder
+from kokoro.voice_recorder import CHANNELS, FRAME_DURATION, JITTER_FRAMES, SAMPLE_RATE, VoiceRecorder
+
+# Interleaved stereo int16 samples in one 20 ms frame
+_FRAME_SAMPLES = int(SAMPLE_RATE * FRAME_DURATION) * CHANNELS
+
+
+class _FakeVoiceClient:
+    def listen(self, sink: object) -> None:
+        pass
+
+    def stop_listening(self) -> None:
+        pass
+
+
+class _Clock:
+    """Stand-in for ``time.monotonic`` that tests move in whole 20 ms slots."""
+
+    _START = 1000.0
+
+    def __init__(self) -> None:
+        self.now = self._START
+
+    def __call__(self) -> float:
+        return self.now
+
+    def at_slot(self, slot: int) -> None:
+        # Mid-slot, so float rounding never lands a packet in a neighbouring slot
+        self.now = self._START + (slot + 0.5) * FRAME_DURATION
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(voice_recorder.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def recorder(clock: _Clock, tmp_path: Path) -> VoiceRecorder:
+    recorder = VoiceRecorder()
+    recorder.start(_FakeVoiceClient(), output_dir=tmp_path)  # type: ignore[arg-type]
+    return recorder
+
+
+def _speak(recorder: VoiceRecorder, speaker: int, value: int) -> None:
+    """Feed *recorder* one frame from *speaker* where every sample is *value*."""
+    pcm = np.full(_FRAME_SAMPLES, value, dtype=np.int16).tobytes()
+    recorder._on_audio(types.SimpleNamespace(id=speaker), types.SimpleNamespace(pcm=pcm))  # type: ignore[arg-type]
+
+
+def _read_frames(path: Path) -> np.ndarray:
+    """Return the WAV's samples, one row per 20 ms frame."""
+    with wave.open(str(path), "rb") as wf:
+        samples = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+    return samples.reshape(-1, _FRAME_SAMPLES)
+
+
+class TestMixing:
+    async def test_overlapping_speakers_are_summed_and_clipped(
+        self, recorder: VoiceRecorder, clock: _Clock
+    ) -> None:
+        _speak(recorder, 1, 20_000)
+        _speak(recorder, 2, 20_000)
+        clock.at_slot(1)
+        _speak(recorder, 1, 1_000)
+        _speak(recorder, 2, -3_000)
+
+        frames = _read_frames(await recorder.stop())
+
+        assert (frames[0] == 32767).all()
+        assert (frames[1] == -2_000).all()
+
+    async def test_frame_count_matches_occupied_slots(self, recorder: VoiceRecorder, clock: _Clock) -> None:
+        # Two packets from one speaker at once take consecutive slots
+        _speak(recorder, 1, 100)
+        _speak(recorder, 1, 200)
+        # A long silence is skipped, not written out as zeros
+        clock.at_slot(50)
+        _speak(recorder, 2, 300)
+
+        frames = _read_frames(await recorder.stop())
+
+        assert [int(f[0]) for f in frames] == [100, 200, 300]
+
+    async def test_old_slots_are_flushed_during_recording(self, recorder: VoiceRecorder, clock: _Clock) -> None:
+        _speak(recorder, 1, 100)
+        clock.at_slot(JITTER_FRAMES + 2)
+        _speak(recorder, 1, 200)
+
+        # Slot 0 fell out of the jitter window and was written; the new one is held back
+        assert list(recorder._mix) == [JITTER_FRAMES + 2]
+        await recorder.stop()
+
+    async def test_nothing_is_written_after_stop(self, recorder: VoiceRecorder, clock: _Clock) -> None:
+        _speak(recorder, 1, 100)
+        wav_path = await recorder.stop()
+        size = wav_path.stat().st_size
+
+        clock.at_slot(1)
+        _speak(recorder, 1, 200)
+
+        assert wav_path.stat().st_size == size
+        assert len(_read_frames(wav_path)) == 1